@@ -290,16 +290,16 @@ class _OverviewTab extends StatelessWidget {
 }
 
 /// Request tab showing request headers and body
-class _RequestTab extends StatelessWidget {
+class _RequestTab extends ConsumerWidget {
   final NetworkFlow flow;
 
   const _RequestTab({required this.flow});
 
   @override
-  Widget build(BuildContext context) {
+  Widget build(BuildContext context, WidgetRef ref) {
     final request = flow.request;
     final headers = request.headers;
-    final body = request.bodyText;
+    final body = request.bodyText ?? request.bodyBytes;
 
     return DefaultTabController(
       length: 2,
@@ -329,7 +329,14 @@ class _RequestTab extends StatelessWidget {
               child: TabBarView(
                 children: [
                   HeadersView(headers: headers),
-                  BodyViewer(body: body),
+                  BodyViewer(
+                    key: ValueKey('${flow.id}-request'),
+                    body: body,
+                    onLoadBody: body == null && request.bodyAvailable
+                        ? () => ref.read(homeControllerProvider.notifier).fetchBody(flow.id, response: false)
+                        : null,
+                    bodyOmitted: request.bodyOmitted,
+                  ),
                 ],
               ),
             ),
@@ -341,13 +348,13 @@ class _RequestTab extends StatelessWidget {
 }
 
 /// Response tab showing response headers and body
-class _ResponseTab extends StatelessWidget {
+class _ResponseTab extends ConsumerWidget {
   final NetworkFlow flow;
 
   const _ResponseTab({required this.flow});
 
   @override
-  Widget build(BuildContext context) {
+  Widget build(BuildContext context, WidgetRef ref) {
     final response = flow.response;
     if (response == null) {
       return const Center(
@@ -367,7 +374,7 @@ class _ResponseTab extends StatelessWidget {
     }
 
     final headers = response.headers;
-    final body = response.bodyText;
+    final body = response.bodyText ?? response.bodyBytes;
 
     return DefaultTabController(
       length: 2,
@@ -397,7 +404,14 @@ class _ResponseTab extends StatelessWidget {
               child: TabBarView(
                 children: [
                   HeadersView(headers: headers),
-                  BodyViewer(body: body),
+                  BodyViewer(
+                    key: ValueKey('${flow.id}-response'),
+                    body: body,
+                    onLoadBody: body == null && response.bodyAvailable
+                        ? () => ref.read(homeControllerProvider.notifier).fetchBody(flow.id)
+                        : null,
+                    bodyOmitted: response.bodyOmitted,
+                  ),
                 ],
               ),
             ),
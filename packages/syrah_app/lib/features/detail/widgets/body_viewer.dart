@@ -11,10 +11,18 @@ class BodyViewer extends StatefulWidget {
   final dynamic body;
   final String? contentType;
 
+  /// Loads a body that was too large to be sent inline with the flow
+  final Future<List<int>?> Function()? onLoadBody;
+
+  /// Whether the body was too large to be kept by the proxy
+  final bool bodyOmitted;
+
   const BodyViewer({
     super.key,
     required this.body,
     this.contentType,
+    this.onLoadBody,
+    this.bodyOmitted = false,
   });
 
   @override
@@ -25,29 +33,28 @@ class _BodyViewerState extends State<BodyViewer> {
   bool _showRaw = false;
   bool _wordWrap = true;
   String _searchQuery = '';
+  dynamic _loadedBody;
+  bool _loadingBody = false;
+  bool _bodyUnavailable = false;
+
+  dynamic get _body => widget.body ?? _loadedBody;
 
   @override
   Widget build(BuildContext context) {
-    if (widget.body == null || widget.body.toString().isEmpty) {
-      return Center(
-        child: Column(
-          mainAxisAlignment: MainAxisAlignment.center,
-          children: [
-            Icon(
-              Icons.code_off,
-              size: 48,
-              color: Theme.of(context).colorScheme.outline,
-            ),
-            const SizedBox(height: 12),
-            Text(
-              'No body content',
-              style: TextStyle(
-                color: Theme.of(context).colorScheme.outline,
-              ),
-            ),
-          ],
-        ),
-      );
+    if (_body == null && widget.onLoadBody != null && !_bodyUnavailable) {
+      return _buildLoadPrompt(context);
+    }
+
+    if (_body == null && widget.bodyOmitted) {
+      return _buildEmptyState(context, 'Body too large to display');
+    }
+
+    if (_body == null && _bodyUnavailable) {
+      return _buildEmptyState(context, 'Body is no longer available');
+    }
+
+    if (_body == null || _body.toString().isEmpty) {
+      return _buildEmptyState(context, 'No body content');
     }
 
     final bodyType = _detectBodyType();
@@ -63,11 +70,72 @@ class _BodyViewerState extends State<BodyViewer> {
     );
   }
 
+  Widget _buildEmptyState(BuildContext context, String message) {
+    return Center(
+      child: Column(
+        mainAxisAlignment: MainAxisAlignment.center,
+        children: [
+          Icon(
+            Icons.code_off,
+            size: 48,
+            color: Theme.of(context).colorScheme.outline,
+          ),
+          const SizedBox(height: 12),
+          Text(
+            message,
+            style: TextStyle(
+              color: Theme.of(context).colorScheme.outline,
+            ),
+          ),
+        ],
+      ),
+    );
+  }
+
+  Widget _buildLoadPrompt(BuildContext context) {
+    if (_loadingBody) {
+      return const Center(
+        child: SizedBox(
+          width: 24,
+          height: 24,
+          child: CircularProgressIndicator(strokeWidth: 2),
+        ),
+      );
+    }
+
+    return Center(
+      child: TextButton.icon(
+        onPressed: _loadBody,
+        icon: const Icon(Icons.download, size: 16),
+        label: const Text('Load large body'),
+      ),
+    );
+  }
+
+  Future<void> _loadBody() async {
+    setState(() => _loadingBody = true);
+    final bytes = await widget.onLoadBody!();
+    if (!mounted) return;
+
+    setState(() {
+      _loadingBody = false;
+      if (bytes == null) {
+        _bodyUnavailable = true;
+        return;
+      }
+      try {
+        _loadedBody = utf8.decode(bytes);
+      } on FormatException {
+        _loadedBody = Uint8List.fromList(bytes);
+      }
+    });
+  }
+
   _BodyType _detectBodyType() {
-    final content = widget.body.toString();
+    final content = _body.toString();
 
     // Check if it's binary data
-    if (widget.body is Uint8List) {
+    if (_body is Uint8List) {
       return _BodyType.binary;
     }
 
@@ -121,7 +189,7 @@ class _BodyViewerState extends State<BodyViewer> {
           const SizedBox(width: 8),
           // Size indicator
           Text(
-            _formatSize(widget.body.toString().length),
+            _formatSize(_body.toString().length),
             style: TextStyle(
               fontSize: 11,
               color: Theme.of(context).colorScheme.outline,
@@ -206,7 +274,7 @@ class _BodyViewerState extends State<BodyViewer> {
 
   Widget _buildJsonView() {
     try {
-      final decoded = json.decode(widget.body.toString());
+      final decoded = json.decode(_body.toString());
       return SingleChildScrollView(
         padding: const EdgeInsets.all(12),
         child: _JsonTreeView(
@@ -220,7 +288,7 @@ class _BodyViewerState extends State<BodyViewer> {
   }
 
   Widget _buildRawView() {
-    final content = widget.body.toString();
+    final content = _body.toString();
     return SingleChildScrollView(
       padding: const EdgeInsets.all(12),
       child: SelectableText(
@@ -232,7 +300,7 @@ class _BodyViewerState extends State<BodyViewer> {
 
   Widget _buildSyntaxView() {
     // Basic syntax highlighting for XML/HTML
-    final content = widget.body.toString();
+    final content = _body.toString();
     return SingleChildScrollView(
       padding: const EdgeInsets.all(12),
       child: SelectableText.rich(
@@ -245,9 +313,9 @@ class _BodyViewerState extends State<BodyViewer> {
   Widget _buildImageView() {
     // Try to display the image
     try {
-      final bytes = widget.body is Uint8List
-          ? widget.body as Uint8List
-          : Uint8List.fromList(widget.body.toString().codeUnits);
+      final bytes = _body is Uint8List
+          ? _body as Uint8List
+          : Uint8List.fromList(_body.toString().codeUnits);
       return Center(
         child: InteractiveViewer(
           child: Image.memory(bytes),
@@ -268,9 +336,9 @@ class _BodyViewerState extends State<BodyViewer> {
   }
 
   Widget _buildHexView() {
-    final bytes = widget.body is Uint8List
-        ? widget.body as Uint8List
-        : Uint8List.fromList(widget.body.toString().codeUnits);
+    final bytes = _body is Uint8List
+        ? _body as Uint8List
+        : Uint8List.fromList(_body.toString().codeUnits);
 
     final buffer = StringBuffer();
     for (var i = 0; i < bytes.length; i += 16) {
@@ -353,7 +421,7 @@ class _BodyViewerState extends State<BodyViewer> {
   }
 
   void _copyBody() {
-    Clipboard.setData(ClipboardData(text: widget.body.toString()));
+    Clipboard.setData(ClipboardData(text: _body.toString()));
     ScaffoldMessenger.of(context).showSnackBar(
       const SnackBar(
         content: Text('Body copied to clipboard'),
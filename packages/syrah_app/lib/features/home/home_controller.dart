@@ -1,5 +1,7 @@
 import 'dart:async';
+import 'dart:convert';
 import 'dart:io';
+import 'dart:typed_data';
 
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import 'package:syrah_core/models/models.dart';
@@ -278,6 +280,19 @@ class HomeController extends StateNotifier<HomeState> {
     if (existingIndex != -1) {
       // Update existing flow
       print('[HomeController] Updating existing flow at index $existingIndex');
+      final existing = state.flows[existingIndex];
+      // Large request bodies are only sent once; keep one fetched earlier
+      if (flow.request.bodyText == null &&
+          flow.request.bodyBytes == null &&
+          flow.request.contentLength == existing.request.contentLength &&
+          (existing.request.bodyText != null || existing.request.bodyBytes != null)) {
+        flow = flow.copyWith(
+          request: flow.request.copyWith(
+            bodyText: existing.request.bodyText,
+            bodyBytes: existing.request.bodyBytes,
+          ),
+        );
+      }
       final newFlows = List<NetworkFlow>.from(state.flows);
       newFlows[existingIndex] = flow;
       state = state.copyWith(
@@ -541,6 +556,48 @@ class HomeController extends StateNotifier<HomeState> {
     _bridge.killFlow(flowId);
   }
 
+  /// Fetch a body that was too large to be sent inline with its flow.
+  ///
+  /// The fetched body is stored back into the flow so exports, cURL, diff
+  /// and search see it too.
+  Future<List<int>?> fetchBody(String flowId, {bool response = true}) async {
+    final bytes = await _bridge.fetchBody(flowId, response: response);
+    if (bytes == null) return null;
+
+    final index = state.flows.indexWhere((f) => f.id == flowId);
+    if (index == -1) return bytes;
+
+    // Keep text bodies as text and anything else as raw bytes
+    String? text;
+    try {
+      text = utf8.decode(bytes);
+    } on FormatException {
+      text = null;
+    }
+    final raw = text == null ? Uint8List.fromList(bytes) : null;
+
+    final flow = state.flows[index];
+    final NetworkFlow updated;
+    if (response) {
+      if (flow.response == null) return bytes;
+      updated = flow.copyWith(
+        response: flow.response!.copyWith(bodyText: text, bodyBytes: raw),
+      );
+    } else {
+      updated = flow.copyWith(
+        request: flow.request.copyWith(bodyText: text, bodyBytes: raw),
+      );
+    }
+
+    final newFlows = List<NetworkFlow>.from(state.flows);
+    newFlows[index] = updated;
+    state = state.copyWith(
+      flows: newFlows,
+      selectedFlow: state.selectedFlow?.id == flowId ? updated : null,
+    );
+    return bytes;
+  }
+
   /// Update proxy rules
   void updateRules(List<ProxyRule> rules) {
     _bridge.updateRules(rules);
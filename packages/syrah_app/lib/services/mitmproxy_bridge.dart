@@ -75,6 +75,9 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
   Timer? _reconnectTimer;
   Timer? _pingTimer;
 
+  /// Pending fetchBody requests, keyed by '<flowId>:<part>'
+  final _pendingBodies = <String, Completer<List<int>?>>{};
+
   final _flowController = StreamController<NetworkFlow>.broadcast();
   final _interceptedController = StreamController<NetworkFlow>.broadcast();
 
@@ -206,6 +209,11 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
     await _channel?.sink.close();
     _channel = null;
 
+    for (final completer in _pendingBodies.values) {
+      completer.complete(null);
+    }
+    _pendingBodies.clear();
+
     _process?.kill();
     _process = null;
 
@@ -258,28 +266,55 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
     });
   }
 
+  /// Frames are newline-delimited JSON (ndjson), one event per line.
+  /// A body frame is a single header line followed by the raw body bytes.
   void _handleMessage(dynamic message) {
     try {
-      debugPrint('MitmproxyBridge: Received message: ${message.toString().substring(0, message.toString().length > 200 ? 200 : message.toString().length)}...');
-      final data = jsonDecode(message as String) as Map<String, dynamic>;
-      final type = data['type'] as String?;
-
-      switch (type) {
-        case 'flow':
-          debugPrint('MitmproxyBridge: Processing flow event');
-          _handleFlowEvent(data);
-          break;
-        case 'pong':
-          // Ping response, ignore
-          break;
-        default:
-          debugPrint('MitmproxyBridge: Unknown message type: $type');
+      final frame = message is String ? utf8.encode(message) : message as List<int>;
+      var start = 0;
+      while (start < frame.length) {
+        var end = frame.indexOf(0x0A, start);
+        if (end == -1) end = frame.length;
+
+        final line = utf8.decode(frame.sublist(start, end));
+        debugPrint('MitmproxyBridge: Received message: ${line.substring(0, line.length > 200 ? 200 : line.length)}...');
+        final data = jsonDecode(line) as Map<String, dynamic>;
+
+        if (data['type'] == 'body') {
+          _handleBody(data, end < frame.length ? frame.sublist(end + 1) : const <int>[]);
+          return;
+        }
+        _handleEvent(data);
+        start = end + 1;
       }
     } catch (e) {
       debugPrint('MitmproxyBridge: Error parsing message: $e');
     }
   }
 
+  void _handleEvent(Map<String, dynamic> data) {
+    final type = data['type'] as String?;
+
+    switch (type) {
+      case 'flow':
+        debugPrint('MitmproxyBridge: Processing flow event');
+        _handleFlowEvent(data);
+        break;
+      case 'pong':
+        // Ping response, ignore
+        break;
+      default:
+        debugPrint('MitmproxyBridge: Unknown message type: $type');
+    }
+  }
+
+  void _handleBody(Map<String, dynamic> header, List<int> body) {
+    final completer = _pendingBodies.remove('${header['id']}:${header['part']}');
+    if (completer == null) return;
+
+    completer.complete(header['available'] == true ? body : null);
+  }
+
   void _handleFlowEvent(Map<String, dynamic> data) {
     try {
       final flow = _parseFlow(data);
@@ -318,9 +353,12 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
       port: requestData['port'] as int? ?? uri.port,
       path: requestData['path'] as String? ?? uri.path,
       queryString: uri.query.isEmpty ? null : uri.query,
-      headers: Map<String, String>.from(requestData['headers'] as Map? ?? {}),
+      headers: _parseHeaders(requestData['headers']),
+      bodyBytes: _decodeBodyBytes(requestData['bodyBase64']),
       bodyText: requestData['body'] as String?,
       contentLength: requestData['contentLength'] as int? ?? 0,
+      bodyAvailable: requestData['bodyAvailable'] as bool? ?? false,
+      bodyOmitted: requestData['bodyOmitted'] as bool? ?? false,
       timestamp: _parseTimestamp(requestData['timestampStart']),
       isSecure: uri.scheme == 'https',
     );
@@ -330,9 +368,12 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
       response = HttpResponse(
         statusCode: responseData['statusCode'] as int,
         statusMessage: responseData['reason'] as String? ?? '',
-        headers: Map<String, String>.from(responseData['headers'] as Map? ?? {}),
+        headers: _parseHeaders(responseData['headers']),
+        bodyBytes: _decodeBodyBytes(responseData['bodyBase64']),
         bodyText: responseData['body'] as String?,
         contentLength: responseData['contentLength'] as int? ?? 0,
+        bodyAvailable: responseData['bodyAvailable'] as bool? ?? false,
+        bodyOmitted: responseData['bodyOmitted'] as bool? ?? false,
         timestamp: _parseTimestamp(responseData['timestampStart']),
       );
     }
@@ -362,6 +403,26 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
     );
   }
 
+  /// Parse headers sent as [name, value] pairs, joining repeated names like mitmproxy
+  Map<String, String> _parseHeaders(dynamic value) {
+    if (value is Map) return Map<String, String>.from(value);
+    final headers = <String, String>{};
+    // Lowercased name -> first-seen casing, so names merge case-insensitively
+    final names = <String, String>{};
+    for (final pair in value as List? ?? const []) {
+      final name = names.putIfAbsent((pair[0] as String).toLowerCase(), () => pair[0] as String);
+      final headerValue = pair[1] as String;
+      headers.update(name, (existing) => '$existing, $headerValue', ifAbsent: () => headerValue);
+    }
+    return headers;
+  }
+
+  /// Decode a binary body that could not be sent as text
+  List<int>? _decodeBodyBytes(dynamic value) {
+    if (value is! String) return null;
+    return base64Decode(value);
+  }
+
   DateTime _parseTimestamp(dynamic value) {
     if (value == null) return DateTime.now();
     if (value is num) {
@@ -398,6 +459,28 @@ class MitmproxyBridge extends StateNotifier<MitmproxyBridgeState> {
     });
   }
 
+  /// Fetch a body that was too large to be sent inline with its flow.
+  /// Completes with null if the bridge no longer has it.
+  Future<List<int>?> fetchBody(String flowId, {bool response = true}) {
+    final part = response ? 'response' : 'request';
+    final key = '$flowId:$part';
+    var completer = _pendingBodies[key];
+    if (completer == null) {
+      completer = Completer<List<int>?>();
+      _pendingBodies[key] = completer;
+      sendCommand({
+        'command': 'fetchBody',
+        'flowId': flowId,
+        'part': part,
+      });
+    }
+
+    return completer.future.timeout(const Duration(seconds: 10), onTimeout: () {
+      _pendingBodies.remove(key);
+      return null;
+    });
+  }
+
   /// Update proxy rules
   void updateRules(List<ProxyRule> rules) {
     sendCommand({
@@ -10,12 +10,19 @@ Usage:
 """
 
 import asyncio
+import base64
+import copy
+import fnmatch
 import json
 import logging
+import os
+import re
+import socket
 import threading
 import time
+from collections import OrderedDict
 from typing import Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 
 from mitmproxy import http, ctx, websocket
@@ -26,14 +33,123 @@ from mitmproxy.options import Options
 try:
     import websockets
     from websockets.server import serve as ws_serve
-    from websockets.exceptions import ConnectionClosed
+    from websockets.exceptions import ConnectionClosed, ConnectionClosedError
+    from websockets.protocol import State
 except ImportError:
     print("Error: websockets package not installed. Run: pip install websockets")
     raise
 
+# orjson is much faster than the stdlib for large flow bodies, but the bundled
+# mitmproxy runtime may not ship it, so fall back to json transparently.
+try:
+    import orjson
+    from orjson import JSONDecodeError
+except ImportError:
+    orjson = None
+    from json import JSONDecodeError
+
+# Hyperscan matches every rule pattern in a single pass; without it (e.g. no
+# wheel for the platform) rules are matched one compiled regex at a time.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# uvloop speeds up the WebSocket server's event loop; it is unavailable on
+# Windows, where the default asyncio loop is used instead.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("syrah_bridge")
 
+# Pending messages per client before the oldest are dropped for a slow consumer
+CLIENT_QUEUE_MAXSIZE = 1024
+
+# Bodies up to this size are sent inline; larger ones are fetched on demand
+INLINE_BODY_MAX = 65_536
+
+# Large request/response bodies kept for fetchBody, oldest evicted first once
+# either the entry count or the total size is exceeded
+BODY_STORE_MAXSIZE = 256
+BODY_STORE_MAX_BYTES = 64 * 1024 * 1024
+
+# Bodies larger than this are neither inlined nor kept for fetchBody
+BODY_STORE_MAX_BODY = 16 * 1024 * 1024
+
+# Map local files kept in memory, least recently used evicted first
+MAP_LOCAL_CACHE_MAXSIZE = 64
+
+# Most queued events a client writer coalesces into a single ndjson frame
+MAX_BATCH_SIZE = 64
+
+# Send buffer for client sockets, sized so bursts of flow events need fewer syscalls
+CLIENT_SNDBUF_SIZE = 1 << 20
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to one newline-terminated line of UTF-8 JSON.
+
+    Every frame sent to Flutter is newline-delimited JSON (ndjson), so
+    serialized events can be concatenated into a single frame as-is.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson rejects lone surrogates, which mitmproxy produces when it
+            # decodes non-UTF-8 headers and paths; json escapes them instead
+            pass
+    return json.dumps(obj, default=str).encode("utf-8") + b"\n"
+
+
+def _loads(data: str | bytes) -> Any:
+    """Deserialize JSON from a str or bytes message."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _glob_to_hs_pattern(pattern: str) -> bytes:
+    """Translate a glob into an anchored regex that Hyperscan can compile.
+
+    fnmatch.translate emits lookaheads and backreferences, which Hyperscan
+    does not support, so *, ? and [...] are translated here directly.
+    """
+    parts = ["^"]
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            parts.append(".*")
+        elif c == "?":
+            parts.append(".")
+        elif c == "[":
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                parts.append("\\[")
+            else:
+                chars = pattern[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if chars.startswith("!"):
+                    chars = "^" + chars[1:]
+                elif chars.startswith("^"):
+                    chars = "\\" + chars
+                parts.append(f"[{chars}]")
+        else:
+            parts.append(re.escape(c))
+    parts.append("$")
+    return "".join(parts).encode("utf-8")
+
 
 class RuleType(Enum):
     BREAKPOINT = "breakpoint"
@@ -42,7 +158,7 @@ class RuleType(Enum):
     BLOCK = "block"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyRule:
     id: str
     type: str
@@ -57,6 +173,42 @@ class ProxyRule:
     status_code: Optional[int] = None
     headers: Optional[dict] = None
     body: Optional[str] = None
+    # Compiled url_pattern, built once so matching a flow never recompiles
+    regex: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Glob-style pattern, e.g. "*/api/*" matches "https://example.com/api/users"
+        self.regex = re.compile(fnmatch.translate(self.url_pattern))
+
+
+@dataclass(slots=True)
+class FlowSnapshot:
+    """Point-in-time copy of a flow, safe to serialize off the mitmproxy thread."""
+    id: str
+    phase: str
+    url: str
+    intercepted: bool
+    # None when request_data was already serialized for an earlier event
+    request: Optional[http.Request]
+    response: Optional[http.Response]
+    error: Optional[str]
+    timestamp: float
+    request_data: Optional[dict]
+
+
+def _snapshot_message(message: http.Message) -> http.Message:
+    """Detach a request/response from the live flow.
+
+    Bodies are immutable bytes and can be shared, but headers are edited in
+    place by mitmproxy and _handle_resume, so they get their own copy. This is
+    several times cheaper than Message.copy(), which round-trips get_state().
+    """
+    snapshot = copy.copy(message)
+    snapshot.data = copy.copy(message.data)
+    snapshot.data.headers = http.Headers(message.headers.fields)
+    if message.trailers is not None:
+        snapshot.data.trailers = http.Headers(message.trailers.fields)
+    return snapshot
 
 
 class SyrahBridge:
@@ -65,13 +217,31 @@ class SyrahBridge:
     """
 
     def __init__(self):
-        self.ws_clients: set = set()
+        # Connected client -> queue of messages drained by its writer task
+        self.ws_clients: dict[Any, asyncio.Queue] = {}
         self.ws_server = None
         self.ws_thread = None
         self.rules: list[ProxyRule] = []
+        # Cached so hooks can skip rule matching without scanning self.rules
+        self._has_rules = False
         self.intercepted_flows: dict[str, Flow] = {}
+        # Map local file path -> (mtime_ns, contents)
+        self._map_local_cache: OrderedDict[str, tuple[int, bytes]] = OrderedDict()
+        self._map_local_lock = threading.Lock()
+        # (flow id, "request" | "response") -> large decoded body, with the
+        # running total of stored bytes. Only touched on the WebSocket loop.
+        self._body_store: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._body_store_bytes = 0
+        # Flow id -> serialized request half of its request event, reused by the
+        # response event since the request does not change in between. Only
+        # modified on the WebSocket loop; the mitmproxy thread just reads it.
+        self._request_data: dict[str, dict] = {}
         self.port = 9999
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # (phase, rule type) -> (enabled rules in priority order, Hyperscan
+        # database over them or None). Replaced wholesale so hooks on the
+        # mitmproxy thread never pair a bucket with another bucket's database.
+        self._matchers: dict[tuple[str, str], tuple[list[ProxyRule], Any]] = {}
 
     def load(self, loader):
         """Register addon options."""
@@ -100,7 +270,7 @@ class SyrahBridge:
     def _start_ws_server(self):
         """Start the WebSocket server in a background thread."""
         def run_server():
-            self._loop = asyncio.new_event_loop()
+            self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
             self._loop.run_until_complete(self._ws_server_main())
 
@@ -115,7 +285,10 @@ class SyrahBridge:
     async def _ws_server_main(self):
         """Main WebSocket server coroutine."""
         try:
-            async with ws_serve(self._handle_client, "localhost", self.port):
+            # permessage-deflate would recompress every event once per client;
+            # the Flutter app talks to us over loopback, where bandwidth is
+            # cheap and the CPU is better spent proxying traffic
+            async with ws_serve(self._handle_client, "localhost", self.port, compression=None):
                 logger.info(f"Syrah WebSocket server listening on ws://localhost:{self.port}")
                 await asyncio.Future()  # Run forever
         except Exception as e:
@@ -123,22 +296,62 @@ class SyrahBridge:
 
     async def _handle_client(self, websocket):
         """Handle a WebSocket client connection."""
-        self.ws_clients.add(websocket)
+        self._tune_client_socket(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_MAXSIZE)
+        self.ws_clients[websocket] = queue
+        writer = asyncio.create_task(self._client_writer(websocket, queue))
         logger.info(f"Flutter client connected. Total clients: {len(self.ws_clients)}")
 
         try:
+            # Ends quietly on a normal close; only abnormal closures raise
             async for message in websocket:
                 await self._process_command(websocket, message)
-        except ConnectionClosed:
+        except ConnectionClosedError:
+            # e.g. the app was killed during a hot restart; websockets would
+            # otherwise log this as a failed connection handler
             pass
         finally:
-            self.ws_clients.discard(websocket)
+            writer.cancel()
+            self.ws_clients.pop(websocket, None)
+            if not self.ws_clients:
+                # Flows still in progress won't be sent, so their requests can't be reused
+                self._request_data.clear()
             logger.info(f"Flutter client disconnected. Total clients: {len(self.ws_clients)}")
 
-    async def _process_command(self, websocket, message: str):
+    def _tune_client_socket(self, websocket):
+        """Disable Nagle's algorithm and enlarge the send buffer for a client."""
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, CLIENT_SNDBUF_SIZE)
+        except OSError as e:
+            logger.warning(f"Could not tune client socket: {e}")
+
+    async def _client_writer(self, websocket, queue: asyncio.Queue):
+        """Send queued messages to a single client, in order.
+
+        Events that pile up while a send is in flight are concatenated into
+        one ndjson frame.
+        """
+        try:
+            while websocket.state is State.OPEN:
+                messages = [await queue.get()]
+                while len(messages) < MAX_BATCH_SIZE and not queue.empty():
+                    messages.append(queue.get_nowait())
+
+                if websocket.state is not State.OPEN:
+                    break
+                await websocket.send(b"".join(messages))
+        except ConnectionClosed:
+            # The connection dropped mid-send; _handle_client cleans up
+            pass
+
+    async def _process_command(self, websocket, message: str | bytes):
         """Process a command from the Flutter app."""
         try:
-            cmd = json.loads(message)
+            cmd = _loads(message)
             command_type = cmd.get("command")
 
             if command_type == "resume":
@@ -147,12 +360,14 @@ class SyrahBridge:
                 await self._handle_kill(cmd)
             elif command_type == "updateRules":
                 await self._handle_update_rules(cmd)
+            elif command_type == "fetchBody":
+                await self._handle_fetch_body(websocket, cmd)
             elif command_type == "ping":
-                await websocket.send(json.dumps({"type": "pong"}))
+                await websocket.send(_dumps({"type": "pong"}))
             else:
                 logger.warning(f"Unknown command: {command_type}")
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             logger.error(f"Invalid JSON command: {e}")
         except Exception as e:
             logger.error(f"Error processing command: {e}")
@@ -168,6 +383,8 @@ class SyrahBridge:
             if modified:
                 # Apply modifications
                 if "request" in modified:
+                    # The cached serialized request no longer matches
+                    self._request_data.pop(flow_id, None)
                     req_mod = modified["request"]
                     if "method" in req_mod:
                         flow.request.method = req_mod["method"]
@@ -207,6 +424,24 @@ class SyrahBridge:
         else:
             logger.warning(f"Flow not found for kill: {flow_id}")
 
+    async def _handle_fetch_body(self, websocket, cmd: dict):
+        """Send a large body that was left out of its flow event.
+
+        The reply is a single frame: an ndjson header line followed by the raw
+        body bytes, so the body is neither base64 encoded nor JSON escaped.
+        """
+        flow_id = cmd.get("flowId")
+        part = cmd.get("part", "response")
+        body = self._body_store.get((flow_id, part))
+        header = {"type": "body", "id": flow_id, "part": part, "available": body is not None}
+
+        if body is None:
+            logger.warning(f"Body not found for fetch: {flow_id} ({part})")
+            await websocket.send(_dumps(header))
+            return
+
+        await websocket.send(_dumps(header) + body)
+
     async def _handle_update_rules(self, cmd: dict):
         """Update the rules list."""
         rules_data = cmd.get("rules", [])
@@ -225,76 +460,132 @@ class SyrahBridge:
             )
             for r in rules_data
         ]
+        buckets: dict[tuple[str, str], list[ProxyRule]] = {}
+        for rule in self.rules:
+            if rule.enabled:
+                buckets.setdefault((rule.phase, rule.type), []).append(rule)
+        matchers = {key: (rules, self._compile_hs_db(key, rules)) for key, rules in buckets.items()}
+        self._matchers = matchers
+        self._has_rules = bool(matchers)
         logger.info(f"Updated rules: {len(self.rules)} rules")
 
-    def _matches_pattern(self, url: str, pattern: str) -> bool:
-        """Check if a URL matches a pattern (supports wildcards)."""
-        import fnmatch
-        # Convert URL pattern to glob pattern
-        # e.g., "*/api/*" matches "https://example.com/api/users"
-        return fnmatch.fnmatch(url, pattern)
+    def _compile_hs_db(self, key: tuple[str, str], rules: list[ProxyRule]) -> Any:
+        """Compile a rule bucket into one Hyperscan database, or None to use regex matching."""
+        if hyperscan is None:
+            return None
 
-    def _find_matching_rule(self, flow: Flow, phase: str, rule_type: Optional[str] = None) -> Optional[ProxyRule]:
-        """Find the first matching rule for a flow."""
-        url = flow.request.pretty_url
-
-        for rule in self.rules:
-            if not rule.enabled:
-                continue
-            if rule.phase != phase:
-                continue
-            if rule_type and rule.type != rule_type:
-                continue
-            if self._matches_pattern(url, rule.url_pattern):
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[_glob_to_hs_pattern(rule.url_pattern) for rule in rules],
+                ids=list(range(len(rules))),
+                elements=len(rules),
+                flags=hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH,
+            )
+        except Exception as e:
+            logger.warning(f"Hyperscan compile failed for {key}, using regex matching: {e}")
+            return None
+        return db
+
+    def _matches_rule(self, url: str, rule: ProxyRule) -> bool:
+        """Check if a URL matches a rule's pattern (supports wildcards)."""
+        return rule.regex.match(url) is not None
+
+    def _find_matching_rule(self, url: str, phase: str, rule_type: str) -> Optional[ProxyRule]:
+        """Find the first matching rule of a type for a flow's URL."""
+        matcher = self._matchers.get((phase, rule_type))
+        if matcher is None:
+            return None
+
+        rules, db = matcher
+        # The database matches bytes, so "?" would match a single byte of a
+        # multi-byte character; non-ASCII URLs use the regex path instead
+        if db is not None and url.isascii():
+            return self._scan_hs(db, rules, url)
+
+        for rule in rules:
+            if self._matches_rule(url, rule):
                 return rule
 
         return None
 
-    def _send_flow_to_clients(self, flow: Flow, phase: str):
-        """Send a flow event to all connected WebSocket clients."""
+    def _scan_hs(self, db: Any, rules: list[ProxyRule], url: str) -> Optional[ProxyRule]:
+        """Scan a URL against a Hyperscan database, returning the first listed match."""
+        matched: list[int] = []
+
+        def on_match(rule_index, start, end, flags, context):
+            matched.append(rule_index)
+
+        db.scan(url.encode("ascii"), match_event_handler=on_match)
+        return rules[min(matched)] if matched else None
+
+    def _send_flow_to_clients(self, flow: Flow, phase: str, url: Optional[str] = None):
+        """Send a flow event to all connected WebSocket clients.
+
+        Pass url when the hook already computed flow.request.pretty_url.
+        """
         if not self.ws_clients:
             return
 
-        event = self._serialize_flow(flow, phase)
-        message = json.dumps(event)
-
-        # Schedule sending on the WebSocket thread's event loop
+        # Only the response event reuses the request half; the request event
+        # always rebuilds it, and errors may leave the request half-processed
+        request_data = self._request_data.get(flow.id) if phase == "response" else None
+
+        # Only take a cheap snapshot here so mitmproxy's hooks return quickly;
+        # decoding and serializing happen on the WebSocket thread's event loop
+        snapshot = FlowSnapshot(
+            id=flow.id,
+            phase=phase,
+            url=url if url is not None else flow.request.pretty_url,
+            intercepted=flow.intercepted,
+            request=_snapshot_message(flow.request) if request_data is None else None,
+            response=_snapshot_message(flow.response) if flow.response else None,
+            error=str(flow.error) if flow.error else None,
+            timestamp=time.time(),
+            request_data=request_data,
+        )
         if self._loop:
-            asyncio.run_coroutine_threadsafe(
-                self._broadcast(message),
-                self._loop
-            )
+            self._loop.call_soon_threadsafe(self._broadcast_flow, snapshot)
 
-    async def _broadcast(self, message: str):
-        """Broadcast a message to all connected clients."""
-        if self.ws_clients:
-            await asyncio.gather(
-                *[client.send(message) for client in self.ws_clients],
-                return_exceptions=True
-            )
+    def _broadcast_flow(self, snapshot: FlowSnapshot):
+        """Serialize a flow snapshot once and queue it for all clients."""
+        self._broadcast(_dumps(self._serialize_flow(snapshot)))
 
-    def _serialize_flow(self, flow: Flow, phase: str) -> dict:
-        """Serialize a flow to JSON for the Flutter app."""
-        request_data = {
-            "method": flow.request.method,
-            "url": flow.request.pretty_url,
-            "host": flow.request.host,
-            "port": flow.request.port,
-            "path": flow.request.path,
-            "httpVersion": flow.request.http_version,
-            "headers": dict(flow.request.headers),
-            "contentLength": len(flow.request.content) if flow.request.content else 0,
-            "timestampStart": flow.request.timestamp_start,
-            "timestampEnd": flow.request.timestamp_end,
-        }
-
-        # Include body for smaller requests
-        if flow.request.content and len(flow.request.content) < 1_000_000:
-            try:
-                request_data["body"] = flow.request.get_text()
-            except:
-                request_data["body"] = None
-                request_data["bodyBase64"] = flow.request.content.hex() if flow.request.content else None
+    def _broadcast(self, message: bytes):
+        """Queue a message for all connected clients (runs on the WebSocket loop)."""
+        for websocket, queue in self.ws_clients.items():
+            # Closing clients are removed by _handle_client; don't queue for them
+            if websocket.state is not State.OPEN:
+                continue
+            if queue.full():
+                # Slow consumer: drop its oldest pending message
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    def _serialize_flow(self, flow: FlowSnapshot) -> dict:
+        """Serialize a flow snapshot to JSON for the Flutter app."""
+        request_data = flow.request_data
+        if flow.phase != "request":
+            # The flow's last event, so its cached request half is no longer needed
+            self._request_data.pop(flow.id, None)
+        if request_data is None:
+            request_data = {
+                "method": flow.request.method,
+                "url": flow.url,
+                "host": flow.request.host,
+                "port": flow.request.port,
+                "path": flow.request.path,
+                "httpVersion": flow.request.http_version,
+                # [name, value] pairs: a dict would merge repeated headers like Set-Cookie
+                "headers": list(flow.request.headers.items(multi=True)),
+                "contentLength": len(flow.request.content) if flow.request.content else 0,
+                "timestampStart": flow.request.timestamp_start,
+                "timestampEnd": flow.request.timestamp_end,
+            }
+            self._add_body(request_data, flow.id, "request", flow.request)
+            if flow.phase == "request":
+                # Shared with the response event, so it must not be modified after this
+                self._request_data[flow.id] = request_data
 
         response_data = None
         if flow.response:
@@ -302,84 +593,143 @@ class SyrahBridge:
                 "statusCode": flow.response.status_code,
                 "reason": flow.response.reason,
                 "httpVersion": flow.response.http_version,
-                "headers": dict(flow.response.headers),
+                "headers": list(flow.response.headers.items(multi=True)),
                 "contentLength": len(flow.response.content) if flow.response.content else 0,
                 "timestampStart": flow.response.timestamp_start,
                 "timestampEnd": flow.response.timestamp_end,
             }
-
-            # Include body for smaller responses
-            if flow.response.content and len(flow.response.content) < 1_000_000:
-                try:
-                    response_data["body"] = flow.response.get_text()
-                except:
-                    response_data["body"] = None
+            self._add_body(response_data, flow.id, "response", flow.response)
 
         return {
             "type": "flow",
-            "phase": phase,
+            "phase": flow.phase,
             "id": flow.id,
             "intercepted": flow.intercepted,
             "request": request_data,
             "response": response_data,
-            "timestamp": time.time(),
-            "error": str(flow.error) if flow.error else None,
+            "timestamp": flow.timestamp,
+            "error": flow.error,
         }
 
+    def _add_body(self, data: dict, flow_id: str, part: str, message: http.Message):
+        """Inline a small body into serialized data, or keep a large one for fetchBody."""
+        content = message.content
+        if not content:
+            return
+
+        if len(content) > BODY_STORE_MAX_BODY:
+            data["bodyOmitted"] = True
+            return
+
+        if len(content) > INLINE_BODY_MAX:
+            data["bodyAvailable"] = True
+            self._store_body((flow_id, part), content)
+            return
+
+        try:
+            data["body"] = message.get_text()
+        except:
+            data["body"] = None
+            data["bodyBase64"] = base64.b64encode(content).decode("ascii")
+
+    def _store_body(self, key: tuple[str, str], content: bytes):
+        """Keep a large body for fetchBody, evicting the oldest past the store limits."""
+        previous = self._body_store.pop(key, None)
+        if previous is not None:
+            self._body_store_bytes -= len(previous)
+
+        self._body_store[key] = content
+        self._body_store_bytes += len(content)
+        while len(self._body_store) > BODY_STORE_MAXSIZE or self._body_store_bytes > BODY_STORE_MAX_BYTES:
+            _, evicted = self._body_store.popitem(last=False)
+            self._body_store_bytes -= len(evicted)
+
+    def _read_map_local_file(self, path: str) -> bytes:
+        """Read a map local file, serving repeat hits from memory until it changes."""
+        mtime = os.stat(path).st_mtime_ns
+
+        with self._map_local_lock:
+            cached = self._map_local_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._map_local_cache.move_to_end(path)
+                return cached[1]
+
+        with open(path, "rb") as f:
+            content = f.read()
+
+        with self._map_local_lock:
+            self._map_local_cache[path] = (mtime, content)
+            self._map_local_cache.move_to_end(path)
+            while len(self._map_local_cache) > MAP_LOCAL_CACHE_MAXSIZE:
+                self._map_local_cache.popitem(last=False)
+
+        return content
+
     # mitmproxy event hooks
 
     def request(self, flow: http.HTTPFlow):
         """Called when a request is received."""
+        # Nothing to match and nobody listening: plain passthrough
+        if not self._has_rules and not self.ws_clients:
+            return
+
+        # pretty_url is rebuilt on every access, so compute it once per hook
+        url = flow.request.pretty_url
+
         # Check for breakpoint
-        breakpoint_rule = self._find_matching_rule(flow, "request", RuleType.BREAKPOINT.value)
+        breakpoint_rule = self._find_matching_rule(url, "request", RuleType.BREAKPOINT.value)
         if breakpoint_rule:
             flow.intercept()
             self.intercepted_flows[flow.id] = flow
-            logger.info(f"Breakpoint hit (request): {flow.request.pretty_url}")
+            logger.info(f"Breakpoint hit (request): {url}")
 
         # Check for map remote
-        map_remote_rule = self._find_matching_rule(flow, "request", RuleType.MAP_REMOTE.value)
+        map_remote_rule = self._find_matching_rule(url, "request", RuleType.MAP_REMOTE.value)
         if map_remote_rule and map_remote_rule.target_url:
-            original_url = flow.request.pretty_url
             flow.request.url = map_remote_rule.target_url
-            logger.info(f"Map remote: {original_url} -> {map_remote_rule.target_url}")
+            logger.info(f"Map remote: {url} -> {map_remote_rule.target_url}")
+            url = flow.request.pretty_url
 
         # Check for block
-        block_rule = self._find_matching_rule(flow, "request", RuleType.BLOCK.value)
+        block_rule = self._find_matching_rule(url, "request", RuleType.BLOCK.value)
         if block_rule:
             flow.kill()
-            logger.info(f"Blocked request: {flow.request.pretty_url}")
+            logger.info(f"Blocked request: {url}")
             return
 
         # Send flow to Flutter app
-        self._send_flow_to_clients(flow, "request")
+        self._send_flow_to_clients(flow, "request", url=url)
 
     def response(self, flow: http.HTTPFlow):
         """Called when a response is received."""
+        if not self._has_rules and not self.ws_clients:
+            return
+
+        url = flow.request.pretty_url
+
         # Check for map local
-        map_local_rule = self._find_matching_rule(flow, "response", RuleType.MAP_LOCAL.value)
+        map_local_rule = self._find_matching_rule(url, "response", RuleType.MAP_LOCAL.value)
         if map_local_rule and map_local_rule.file_path:
             try:
-                with open(map_local_rule.file_path, "rb") as f:
-                    content = f.read()
+                content = self._read_map_local_file(map_local_rule.file_path)
                 flow.response = http.Response.make(
                     status_code=map_local_rule.status_code or 200,
                     content=content,
                     headers=map_local_rule.headers or {"Content-Type": "application/octet-stream"}
                 )
-                logger.info(f"Map local: {flow.request.pretty_url} -> {map_local_rule.file_path}")
+                logger.info(f"Map local: {url} -> {map_local_rule.file_path}")
             except Exception as e:
                 logger.error(f"Map local error: {e}")
 
         # Check for breakpoint
-        breakpoint_rule = self._find_matching_rule(flow, "response", RuleType.BREAKPOINT.value)
+        breakpoint_rule = self._find_matching_rule(url, "response", RuleType.BREAKPOINT.value)
         if breakpoint_rule:
             flow.intercept()
             self.intercepted_flows[flow.id] = flow
-            logger.info(f"Breakpoint hit (response): {flow.request.pretty_url}")
+            logger.info(f"Breakpoint hit (response): {url}")
 
         # Send flow to Flutter app
-        self._send_flow_to_clients(flow, "response")
+        self._send_flow_to_clients(flow, "response", url=url)
 
     def error(self, flow: http.HTTPFlow):
         """Called when an error occurs."""
@@ -84,6 +84,12 @@ class HttpRequest with _$HttpRequest {
     /// Content length in bytes
     @Default(0) int contentLength,
 
+    /// Whether a body too large to send inline can be fetched from the proxy
+    @Default(false) bool bodyAvailable,
+
+    /// Whether the body was too large to be kept by the proxy at all
+    @Default(false) bool bodyOmitted,
+
     /// HTTP version used
     @Default(HttpVersion.http1_1) HttpVersion httpVersion,
 
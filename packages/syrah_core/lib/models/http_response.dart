@@ -44,6 +44,12 @@ class HttpResponse with _$HttpResponse {
     /// Content length in bytes
     @Default(0) int contentLength,
 
+    /// Whether a body too large to send inline can be fetched from the proxy
+    @Default(false) bool bodyAvailable,
+
+    /// Whether the body was too large to be kept by the proxy at all
+    @Default(false) bool bodyOmitted,
+
     /// Whether the response body was compressed
     @Default(false) bool wasCompressed,
 